@@ -1,47 +1,77 @@
-import gc
+import functools
 import json
-from pathlib import Path
+import mmap
 import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
 
 import pytest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[2]
 MANIFEST = ROOT / "benchmarks" / "fixtures.json"
+TIER = "full" if os.environ.get("BOLIVAR_BENCH_TIER") == "full" else "quick"
 
 
-def _load_manifest():
-    data = json.loads(MANIFEST.read_text())
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@functools.lru_cache(maxsize=1)
+def _load_manifest() -> dict[str, Any]:
+    data = _loads(MANIFEST.read_bytes())
     assert data.get("version") == 1
+    for fx in data["fixtures"]:
+        fx["_tiers_set"] = frozenset(fx.get("tiers", ()))
+        fx["_tags_set"] = frozenset(fx.get("tags", ()))
     return data
 
 
-def _load_fixtures(tag=None, tier=None):
+@functools.cache
+def _load_fixtures(
+    tag: str | None = None, tier: str | None = None
+) -> tuple[dict[str, Any], ...]:
     data = _load_manifest()
     fixtures = []
     for fx in data["fixtures"]:
-        if tier and tier not in fx.get("tiers", []):
+        if tier and tier not in fx["_tiers_set"]:
             continue
-        if tag and tag not in fx.get("tags", []):
+        if tag and tag not in fx["_tags_set"]:
             continue
         fixtures.append(fx)
-    return fixtures
+    return tuple(fixtures)
 
 
 def pytest_generate_tests(metafunc):
     if "text_fixture" in metafunc.fixturenames:
-        tier = "full" if os.environ.get("BOLIVAR_BENCH_TIER") == "full" else "quick"
-        fixtures = _load_fixtures(tag="text", tier=tier)
+        fixtures = _load_fixtures(tag="text", tier=TIER)
         params = []
         ids = []
         for fx in fixtures:
-            path = ROOT / fx["path"]
-            params.append((fx, path.read_bytes()))
+            params.append((fx, ROOT / fx["path"]))
             ids.append(fx["id"])
-        metafunc.parametrize("text_fixture", params, ids=ids)
+        metafunc.parametrize("text_fixture", params, ids=ids, indirect=True)
 
 
-@pytest.fixture(autouse=True)
-def disable_gc():
-    gc.disable()
-    yield
-    gc.enable()
+@pytest.fixture
+def text_fixture(
+    request: pytest.FixtureRequest,
+) -> Iterator[tuple[dict[str, Any], memoryview]]:
+    # Map the PDF read-only so pages load on demand, and hand every round the
+    # same readonly view so the native side borrows it without copying.
+    fx, path = request.param
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    view = memoryview(mm).toreadonly()
+    try:
+        yield fx, view
+    finally:
+        view.release()
+        mm.close()
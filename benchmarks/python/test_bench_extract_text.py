@@ -1,7 +1,35 @@
+import gc
+
 import bolivar
 
+ROUNDS = 20
+WARMUP_ROUNDS = 2
+
+# Bound once so the timed region is a single native call per round.
+_extract_text = bolivar.extract_text
+
+
+def _gc_setup() -> None:
+    # Start each round from a clean heap and keep the collector out of the
+    # timed call only.
+    gc.collect()
+    gc.disable()
+
+
+def _gc_teardown(*_args: object) -> None:
+    # pedantic passes the target's args to teardown as well.
+    gc.enable()
+
 
 def test_extract_text_bytes(benchmark, text_fixture):
     _, data = text_fixture
-    result = benchmark(lambda: bolivar.extract_text(data, threads=1))
+    result = benchmark.pedantic(
+        _extract_text,
+        args=(data,),
+        setup=_gc_setup,
+        teardown=_gc_teardown,
+        rounds=ROUNDS,
+        warmup_rounds=WARMUP_ROUNDS,
+        iterations=1,
+    )
     assert result is not None
@@ -0,0 +1,42 @@
+# Generated by scripts/gen_native_api_stubs.py; do not edit by hand.
+
+from bolivar import _native_api as _native_api
+from bolivar._bolivar import LAParams as LAParams
+from bolivar._bolivar import LTChar as LTChar
+from bolivar._bolivar import LTPage as LTPage
+from bolivar._bolivar import PDFDocument as PDFDocument
+from bolivar._bolivar import PDFPage as PDFPage
+from bolivar._bolivar import __version__ as __version__
+from bolivar._bolivar import async_runtime_poc as async_runtime_poc
+from bolivar._bolivar import extract_pages as extract_pages
+from bolivar._bolivar import extract_pages_async as extract_pages_async
+from bolivar._bolivar import extract_pages_from_path as extract_pages_from_path
+from bolivar._bolivar import extract_pages_with_images as extract_pages_with_images
+from bolivar._bolivar import (
+    extract_pages_with_images_from_path as extract_pages_with_images_from_path,
+)
+from bolivar._bolivar import extract_text as extract_text
+from bolivar._bolivar import extract_text_from_path as extract_text_from_path
+from bolivar._bolivar import process_page as process_page
+from bolivar._bolivar import process_pages as process_pages
+from bolivar._bolivar import repair_pdf as repair_pdf
+
+__all__ = [
+    "LAParams",
+    "LTChar",
+    "LTPage",
+    "PDFDocument",
+    "PDFPage",
+    "__version__",
+    "async_runtime_poc",
+    "extract_pages",
+    "extract_pages_async",
+    "extract_pages_from_path",
+    "extract_pages_with_images",
+    "extract_pages_with_images_from_path",
+    "extract_text",
+    "extract_text_from_path",
+    "process_page",
+    "process_pages",
+    "repair_pdf",
+]
@@ -1,5 +1,8 @@
 import contextlib
 import sys
+from types import ModuleType
+
+_INSTALLED: ModuleType | None = None
 
 
 def _warn(exc: Exception) -> None:
@@ -20,12 +23,21 @@ def _install_with_shim_registry() -> bool:
     return True
 
 
+def _mark_installed(installed: bool) -> bool:
+    global _INSTALLED
+    if installed:
+        _INSTALLED = sys.modules.get("pdfminer")
+    return installed
+
+
 def install() -> bool:
+    if _INSTALLED is not None and sys.modules.get("pdfminer") is _INSTALLED:
+        return True
     try:
-        return _install_with_top_level_autoload()
+        return _mark_installed(_install_with_top_level_autoload())
     except Exception as primary_exc:
         try:
-            return _install_with_shim_registry()
+            return _mark_installed(_install_with_shim_registry())
         except Exception as fallback_exc:
             _warn(primary_exc)
             _warn(fallback_exc)
@@ -177,6 +177,7 @@ class PDFDocument:
     def page_mediaboxes(self) -> list[_Rect]: ...
     def get_page_labels(self) -> list[str]: ...
     def get_page(self, index: int, /) -> PDFPage: ...
+    def get_pages_batch(self, indices: Sequence[int], /) -> list[PDFPage]: ...
     def getobj(self, objid: int, /) -> Any: ...
 
 class PDFPage:
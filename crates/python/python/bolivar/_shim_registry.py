@@ -1,3 +1,5 @@
+import functools
+import importlib.machinery
 import importlib.util
 import os
 import sys
@@ -5,27 +7,51 @@ from types import ModuleType
 
 _SHIM_PACKAGES = ("pdfminer", "pdfplumber")
 
+_INSTALLED: dict[str, ModuleType] | None = None
+_INSTALLED_BASE: str | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_base() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
 
 def _resolve_base(base: str | None) -> str:
     if base is None:
-        base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        return _default_base()
     return os.path.abspath(base)
 
 
 def _purge_modules(prefixes: tuple[str, ...]) -> None:
-    for name in list(sys.modules.keys()):
-        for prefix in prefixes:
-            if name == prefix or name.startswith(prefix + "."):
-                sys.modules.pop(name, None)
-                break
+    submodule_prefixes = tuple(prefix + "." for prefix in prefixes)
+    stale = [
+        name
+        for name in list(sys.modules)
+        if name in prefixes or name.startswith(submodule_prefixes)
+    ]
+    for name in stale:
+        sys.modules.pop(name, None)
+
+
+@functools.cache
+def _package_spec(
+    name: str, pkg_dir: str, init_py: str, mtime_ns: int
+) -> importlib.machinery.ModuleSpec | None:
+    # mtime_ns only keys the cache so an edited shim gets a fresh spec.
+    del mtime_ns
+    return importlib.util.spec_from_file_location(
+        name, init_py, submodule_search_locations=[pkg_dir]
+    )
 
 
 def _load_package(name: str, base: str) -> ModuleType:
     pkg_dir = os.path.join(base, name)
     init_py = os.path.join(pkg_dir, "__init__.py")
-    spec = importlib.util.spec_from_file_location(
-        name, init_py, submodule_search_locations=[pkg_dir]
-    )
+    try:
+        mtime_ns = os.stat(init_py).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    spec = _package_spec(name, pkg_dir, init_py, mtime_ns)
     if spec is None or spec.loader is None:
         raise ImportError(f"{name} shim not found at {init_py}")
     module = importlib.util.module_from_spec(spec)
@@ -52,11 +78,27 @@ def apply_pdfplumber_patch() -> None:
     bolivar_patch.patch_pdfplumber()
 
 
+def _current_install(base: str) -> dict[str, ModuleType] | None:
+    installed = _INSTALLED
+    if installed is None or base != _INSTALLED_BASE:
+        return None
+    for name, module in installed.items():
+        if sys.modules.get(name) is not module:
+            return None
+    return installed
+
+
 def install(base: str | None = None) -> dict[str, ModuleType]:
+    global _INSTALLED, _INSTALLED_BASE
     base = _resolve_base(base)
+    installed = _current_install(base)
+    if installed is not None:
+        return installed
     _purge_modules(_SHIM_PACKAGES)
     loaded = {}
     for name in _SHIM_PACKAGES:
         loaded[name] = _load_package(name, base)
     ensure_pdfplumber_patched()
+    _INSTALLED = loaded
+    _INSTALLED_BASE = base
     return loaded
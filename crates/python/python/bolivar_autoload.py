@@ -20,6 +20,9 @@ def _ensure_sys_path(base: str) -> None:
 
 def _load_registry_module(base: str) -> ModuleType:
     path = os.path.join(base, "bolivar", "_shim_registry.py")
+    existing = sys.modules.get("bolivar._shim_registry")
+    if existing is not None and getattr(existing, "__file__", None) == path:
+        return existing
     spec = importlib.util.spec_from_file_location("bolivar._shim_registry", path)
     if spec is None or spec.loader is None:
         raise ImportError("bolivar._shim_registry not found")
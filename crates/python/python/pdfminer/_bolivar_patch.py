@@ -1,16 +1,23 @@
+import asyncio
 import importlib.abc
 import importlib.machinery
 import logging
 import sys
 import threading
+from array import array
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import suppress
+from functools import lru_cache
 from io import BufferedReader, BytesIO
+from itertools import accumulate, islice
 from operator import index as to_index
-from os import PathLike, fspath
+from os import PathLike, environ, fspath
 from types import ModuleType, TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    NamedTuple,
     Protocol,
     SupportsIndex,
     TypeAlias,
@@ -49,6 +56,8 @@ class _DocLike(Protocol):
 
     def get_page(self, page_index: int) -> object: ...
 
+    def get_pages_batch(self, indices: Sequence[int]) -> Sequence[object]: ...
+
 
 class _PdfLike(Protocol):
     doc: _DocLike | None
@@ -99,6 +108,92 @@ def _module_from_sys(name: str) -> ModuleType | None:
     return module if isinstance(module, ModuleType) else None
 
 
+# PyO3 surfaces native document failures as ValueError, out-of-range integer
+# conversions as OverflowError, and I/O or internal failures as OSError and
+# RuntimeError. These are wrapped as PdfminerException; anything else, such
+# as a TypeError from a bad argument, propagates unchanged.
+_NATIVE_ERRORS: tuple[type[Exception], ...] = (
+    ValueError,
+    OverflowError,
+    OSError,
+    RuntimeError,
+)
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, else ``default``."""
+    raw = environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        _logger.warning("Ignoring non-integer %s=%r", name, raw)
+        return default
+    return value if value > 0 else default
+
+
+def _running_doctops(boxes: Sequence[Sequence[_Number]]) -> Sequence[float]:
+    """Return the cumulative top offset of each box's page, starting at zero."""
+    heights = (box[3] - box[1] for box in boxes)
+    return array("d", islice(accumulate(heights, initial=0.0), len(boxes)))
+
+
+class _CacheKey:
+    """Hashable wrapper that computes the hash of a nested key only once."""
+
+    __slots__ = ("_hash", "value")
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self._hash = hash(value)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, _CacheKey):
+            return NotImplemented
+        return self._hash == other._hash and self.value == other.value
+
+
+_SettingsMemoEntry: TypeAlias = tuple[dict[Any, Any], dict[Any, Any], _CacheKey]
+
+
+class _PatchDeps(NamedTuple):
+    extract_tables_for_page_indexed: Callable[..., object]
+    extract_tables_from_page_objects: Callable[..., object]
+    extract_tables_stream: Callable[..., object]
+    extract_text_stream: Callable[..., object]
+    extract_words_stream: Callable[..., object]
+    pdfminer_exception: type[Exception]
+
+
+@lru_cache(maxsize=1)
+def _patch_deps() -> _PatchDeps:
+    # Imported on first patch: pdfplumber may still be mid-import when this
+    # module loads.
+    from bolivar._native_api import (
+        _extract_tables_for_page_indexed,
+        _extract_tables_from_page_objects,
+        _extract_tables_stream,
+        _extract_text_stream,
+        _extract_words_stream,
+    )
+    from pdfplumber.utils.exceptions import PdfminerException
+
+    return _PatchDeps(
+        _extract_tables_for_page_indexed,
+        _extract_tables_from_page_objects,
+        _extract_tables_stream,
+        _extract_text_stream,
+        _extract_words_stream,
+        PdfminerException,
+    )
+
+
 def _apply_patch(module: ModuleType) -> bool:
     page_mod: object | None = getattr(module, "page", None)
     if page_mod is None and getattr(module, "__name__", "") == "pdfplumber.page":
@@ -118,42 +213,77 @@ def _apply_patch(module: ModuleType) -> bool:
 
     already_patched = getattr(page_mod.Page.extract_tables, "_bolivar_patched", False)
 
-    from bolivar._native_api import (
+    (
         _extract_tables_for_page_indexed,
         _extract_tables_from_page_objects,
         _extract_tables_stream,
         _extract_text_stream,
         _extract_words_stream,
-    )
-    from pdfplumber.utils.exceptions import PdfminerException
+        PdfminerException,
+    ) = _patch_deps()
 
     def _page_geom(page: _PageLike) -> _PageGeometry:
-        return (
+        # Go through the instance dict so hits skip descriptor lookups.
+        page_dict = page.__dict__
+        cached: _PageGeometry | None = page_dict.get("_bolivar_geom_cache")
+        if cached is not None:
+            return cached
+        geom = (
             tuple(page.bbox),
             tuple(page.mediabox),
             float(page.initial_doctop),
             not getattr(page, "is_original", True),
         )
+        page_dict["_bolivar_geom_cache"] = geom
+        return geom
+
+    def _page_target(page: _PageLike) -> tuple[int, _DocLike | None]:
+        # The page index and owning document never change for a page, so
+        # resolve them once and keep them next to the geometry cache.
+        page_dict = page.__dict__
+        cached: tuple[int, _DocLike] | None = page_dict.get("_bolivar_page_target")
+        if cached is not None:
+            return cached
+        page_obj = page.page_obj
+        page_index = getattr(page_obj, "_page_index", page.page_number - 1)
+        pdf = page.pdf
+        doc: _DocLike | None = pdf.doc if pdf is not None else None
+        if doc is None:
+            doc = getattr(page_obj, "doc", None)
+            if doc is None:
+                return page_index, None
+        target = (page_index, doc)
+        page_dict["_bolivar_page_target"] = target
+        return target
 
     def _safe_page_mediaboxes(doc: _DocLike) -> Sequence[Sequence[_Number]]:
+        cached: Sequence[Sequence[_Number]] | None = getattr(
+            doc, "_bolivar_mediaboxes", None
+        )
+        if cached is not None:
+            return cached
         try:
-            return doc.page_mediaboxes()
-        except PdfminerException:
-            raise
-        except Exception as e:
+            boxes = doc.page_mediaboxes()
+        except _NATIVE_ERRORS as e:
             raise PdfminerException(str(e)) from e
+        # Mediaboxes never change for a loaded document. Native documents
+        # without a __dict__ just skip the cache.
+        with suppress(AttributeError):
+            _set_attr(doc, "_bolivar_mediaboxes", boxes)
+        return boxes
 
     def _base_geometries(doc: _DocLike) -> list[_PageGeometry]:
         boxes = _safe_page_mediaboxes(doc)
-        doctops: list[float] = []
-        running = 0.0
-        for box in boxes:
-            doctops.append(running)
-            running += box[3] - box[1]
-        return [
-            (tuple(box), tuple(box), doctop, False)
-            for box, doctop in zip(boxes, doctops, strict=False)
-        ]
+        doctops = _running_doctops(boxes)
+        # Share one tuple per distinct mediabox so same-sized pages compare by
+        # identity before falling back to element-wise equality.
+        interned: dict[_PageBox, _PageBox] = {}
+        geoms: list[_PageGeometry] = []
+        for box, doctop in zip(boxes, doctops, strict=False):
+            key = tuple(box)
+            shared = interned.setdefault(key, key)
+            geoms.append((shared, shared, doctop, False))
+        return geoms
 
     def _get_base_geometries(
         pdf: object | None,
@@ -168,7 +298,7 @@ def _apply_patch(module: ModuleType) -> bool:
         base = _base_geometries(doc)
         if pdf is not None:
             _set_attr(pdf, "_bolivar_table_geom_base", base)
-            _set_attr(pdf, "_bolivar_table_geom_base_key", tuple(base))
+            _set_attr(pdf, "_bolivar_table_geom_base_key", _CacheKey(tuple(base)))
         return base
 
     def _build_geometries(
@@ -179,32 +309,111 @@ def _apply_patch(module: ModuleType) -> bool:
     ) -> list[_PageGeometry]:
         if base is None:
             base = _base_geometries(doc)
-        current = _page_geom(page)
         if not (0 <= page_index < len(base)):
             return base
-        if base[page_index] == current:
+        current = _page_geom(page)
+        base_geom = base[page_index]
+        if base_geom is current or base_geom == current:
             return base
-        geoms = list(base)
-        if geoms[page_index] != current:
-            geoms[page_index] = current
+        geoms = base.copy()
+        geoms[page_index] = current
         return geoms
 
+    def _geometries_key(
+        pdf: object | None,
+        geometries: Sequence[_PageGeometry],
+        page_index: int | None,
+    ) -> object:
+        # _build_geometries returns the cached base list itself or a copy that
+        # differs only at page_index, so both cases key off the base key.
+        base: list[_PageGeometry] | None = getattr(
+            pdf, "_bolivar_table_geom_base", None
+        )
+        base_key = getattr(pdf, "_bolivar_table_geom_base_key", None)
+        if base is None or base_key is None:
+            return tuple(geometries)
+        if geometries is base:
+            return base_key
+        if (
+            page_index is not None
+            and 0 <= page_index < len(geometries)
+            and len(geometries) == len(base)
+        ):
+            return (base_key, page_index, geometries[page_index])
+        return tuple(geometries)
+
+    def _page_numbers_key(
+        page_numbers: Sequence[int] | None,
+    ) -> tuple[int, ...] | None:
+        if page_numbers is None or isinstance(page_numbers, tuple):
+            return page_numbers
+        return tuple(page_numbers)
+
+    _SCALAR_KEY_TYPES = frozenset((str, int, float, bool, type(None)))
+
     def _normalize_key(value: object) -> object:
+        # Settings values are almost always scalars; return those before the
+        # container checks.
+        if type(value) in _SCALAR_KEY_TYPES:
+            return value
         if isinstance(value, dict):
+            # Interned names let equal keys from different dicts compare by
+            # identity when stream lookups check tuple equality.
             return tuple(
-                sorted((key, _normalize_key(val)) for key, val in value.items())
+                sorted(
+                    (sys.intern(key) if type(key) is str else key, _normalize_key(val))
+                    for key, val in value.items()
+                )
             )
         if isinstance(value, (list, tuple)):
             return tuple(_normalize_key(val) for val in value)
         return value
 
-    def _settings_key(table_settings: object) -> object:
-        return _normalize_key(table_settings)
-
-    def _laparams_key(pdf: object | None) -> object:
-        laparams = getattr(pdf, "laparams", None) if pdf is not None else None
-        if laparams is None:
-            return None
+    _SETTINGS_KEYS_LIMIT = 8
+
+    def _settings_snapshot(settings: dict[Any, Any]) -> dict[Any, Any] | None:
+        # Only flat settings are memoized: a one-level copy then catches any
+        # in-place edit, while nested or custom values are not worth copying.
+        snapshot = dict(settings)
+        for name, value in snapshot.items():
+            if type(value) in _SCALAR_KEY_TYPES:
+                continue
+            if type(value) is not list or any(
+                type(item) not in _SCALAR_KEY_TYPES for item in value
+            ):
+                return None
+            snapshot[name] = value.copy()
+        return snapshot
+
+    def _settings_key(pdf: object | None, table_settings: object) -> object:
+        if pdf is None or not isinstance(table_settings, dict):
+            return _normalize_key(table_settings)
+        # Plain dicts cannot be weakly referenced, so each entry pins its dict
+        # (keeping the id stable) for as long as the pdf holds the memo.
+        memo: OrderedDict[int, _SettingsMemoEntry] | None = getattr(
+            pdf, "_bolivar_settings_keys", None
+        )
+        if memo is None:
+            memo = OrderedDict()
+            _set_attr(pdf, "_bolivar_settings_keys", memo)
+        settings_id = id(table_settings)
+        cached = memo.get(settings_id)
+        if (
+            cached is not None
+            and cached[0] is table_settings
+            and cached[1] == table_settings
+        ):
+            return cached[2]
+        snapshot = _settings_snapshot(table_settings)
+        key = _CacheKey(_normalize_key(table_settings))
+        if snapshot is not None:
+            memo[settings_id] = (table_settings, snapshot, key)
+            while len(memo) > _SETTINGS_KEYS_LIMIT:
+                with suppress(KeyError):
+                    memo.popitem(last=False)
+        return key
+
+    def _compute_laparams_key(laparams: object) -> object:
         try:
             items = getattr(laparams, "__dict__", None)
             if items:
@@ -213,30 +422,68 @@ def _apply_patch(module: ModuleType) -> bool:
             pass
         return repr(laparams)
 
+    _LAPARAMS_FIELDS = (
+        "line_overlap",
+        "char_margin",
+        "line_margin",
+        "word_margin",
+        "boxes_flow",
+        "detect_vertical",
+        "all_texts",
+    )
+
+    def _laparams_key(pdf: object | None) -> object:
+        laparams = getattr(pdf, "laparams", None) if pdf is not None else None
+        if laparams is None:
+            return None
+        # The native LAParams supports neither weakrefs nor __dict__, so memoize
+        # on the pdf. Its fields are settable, so the memo also holds their
+        # values and is reused only while they are unchanged.
+        snapshot = tuple(getattr(laparams, name, None) for name in _LAPARAMS_FIELDS)
+        cached: tuple[object, tuple[object, ...], _CacheKey] | None = getattr(
+            pdf, "_bolivar_laparams_key", None
+        )
+        if cached is not None and cached[0] is laparams and cached[1] == snapshot:
+            return cached[2]
+        key = _CacheKey(_compute_laparams_key(laparams))
+        _set_attr(pdf, "_bolivar_laparams_key", (laparams, snapshot, key))
+        return key
+
     _TEXT_STREAM_CACHE_LIMIT = 2
+    _TABLES_PREFETCH_AFTER_RESTARTS = 4
+    _TABLES_PREFETCH_WINDOW = 32
+    _TABLE_STREAMS_LIMIT = _env_positive_int("BOLIVAR_TABLE_CACHE_MAX", 32)
 
     class _BolivarTextStream:
+        __slots__ = (
+            "_cache",
+            "_cache_limit",
+            "_done",
+            "_lock",
+            "_max_index_seen",
+            "_stream",
+            "_stream_factory",
+        )
+
         def __init__(
             self,
             stream_factory: _TextStreamFactory,
             cache_limit: int = _TEXT_STREAM_CACHE_LIMIT,
         ) -> None:
             self._stream_factory = stream_factory
-            self._stream = iter(stream_factory())
-            self._cache: dict[int, str] = {}
+            # The native stream starts on the first miss, not at construction.
+            self._stream: Iterator[_TextStreamItem] | None = None
+            self._cache: OrderedDict[int, str] = OrderedDict()
             self._done = False
             self._lock = threading.Lock()
             self._max_index_seen = -1
             self._cache_limit = max(int(cache_limit), 0)
 
-        def _evict_cache(self, newest_index: int) -> None:
-            if self._cache_limit <= 0:
-                self._cache.clear()
-                return
-            keep_from = newest_index - (self._cache_limit - 1)
-            for key in list(self._cache.keys()):
-                if key < keep_from:
-                    self._cache.pop(key, None)
+        def _evict_cache(self) -> None:
+            # Pages arrive in stream order, so the oldest entries sit first.
+            cache = self._cache
+            while len(cache) > self._cache_limit:
+                cache.popitem(last=False)
 
         def _get_from_fresh_stream(self, page_index: int) -> str | None:
             stream = iter(self._stream_factory())
@@ -253,40 +500,49 @@ def _apply_patch(module: ModuleType) -> bool:
                     return self._cache[page_index]
                 if page_index < self._max_index_seen or self._done:
                     return self._get_from_fresh_stream(page_index)
+                stream = self._stream
+                if stream is None:
+                    stream = self._stream = iter(self._stream_factory())
                 while page_index not in self._cache:
                     try:
-                        idx, text = next(self._stream)
+                        idx, text = next(stream)
                     except StopIteration:
                         self._done = True
                         break
                     self._cache[idx] = text
                     if idx > self._max_index_seen:
                         self._max_index_seen = idx
-                    self._evict_cache(idx)
+                    self._evict_cache()
                 return self._cache.get(page_index)
 
     class _BolivarWordsStream:
+        __slots__ = (
+            "_cache",
+            "_cache_limit",
+            "_done",
+            "_lock",
+            "_max_index_seen",
+            "_stream",
+            "_stream_factory",
+        )
+
         def __init__(
             self,
             stream_factory: _WordsStreamFactory,
             cache_limit: int = _TEXT_STREAM_CACHE_LIMIT,
         ) -> None:
             self._stream_factory = stream_factory
-            self._stream = iter(stream_factory())
-            self._cache: dict[int, _Words] = {}
+            self._stream: Iterator[_WordsStreamItem] | None = None
+            self._cache: OrderedDict[int, _Words] = OrderedDict()
             self._done = False
             self._lock = threading.Lock()
             self._max_index_seen = -1
             self._cache_limit = max(int(cache_limit), 0)
 
-        def _evict_cache(self, newest_index: int) -> None:
-            if self._cache_limit <= 0:
-                self._cache.clear()
-                return
-            keep_from = newest_index - (self._cache_limit - 1)
-            for key in list(self._cache.keys()):
-                if key < keep_from:
-                    self._cache.pop(key, None)
+        def _evict_cache(self) -> None:
+            cache = self._cache
+            while len(cache) > self._cache_limit:
+                cache.popitem(last=False)
 
         def _get_from_fresh_stream(self, page_index: int) -> _Words | None:
             stream = iter(self._stream_factory())
@@ -303,40 +559,48 @@ def _apply_patch(module: ModuleType) -> bool:
                     return self._cache[page_index]
                 if page_index < self._max_index_seen or self._done:
                     return self._get_from_fresh_stream(page_index)
+                stream = self._stream
+                if stream is None:
+                    stream = self._stream = iter(self._stream_factory())
                 while page_index not in self._cache:
                     try:
-                        idx, words = next(self._stream)
+                        idx, words = next(stream)
                     except StopIteration:
                         self._done = True
                         break
                     self._cache[idx] = words
                     if idx > self._max_index_seen:
                         self._max_index_seen = idx
-                    self._evict_cache(idx)
+                    self._evict_cache()
                 return self._cache.get(page_index)
 
     class _BolivarTablesStream:
+        __slots__ = (
+            "_cache",
+            "_cache_limit",
+            "_done",
+            "_lock",
+            "_max_index_seen",
+            "_prefetch_failed",
+            "_restarts",
+            "_stream",
+            "_stream_factory",
+        )
+
         def __init__(
             self,
             stream_factory: _TablesStreamFactory,
             cache_limit: int = _TEXT_STREAM_CACHE_LIMIT,
         ) -> None:
             self._stream_factory = stream_factory
-            self._stream = iter(stream_factory())
-            self._cache: dict[int, _Tables] = {}
+            self._stream: Iterator[_TablesStreamItem] | None = None
+            self._cache: OrderedDict[int, _Tables] = OrderedDict()
             self._done = False
             self._lock = threading.Lock()
             self._max_index_seen = -1
             self._cache_limit = max(int(cache_limit), 0)
-
-        def _evict_cache(self, newest_index: int) -> None:
-            if self._cache_limit <= 0:
-                self._cache.clear()
-                return
-            keep_from = newest_index - (self._cache_limit - 1)
-            for key in list(self._cache.keys()):
-                if key < keep_from:
-                    self._cache.pop(key, None)
+            self._restarts = 0
+            self._prefetch_failed = False
 
         def _get_from_fresh_stream(self, page_index: int) -> _Tables | None:
             stream = iter(self._stream_factory())
@@ -347,23 +611,82 @@ def _apply_patch(module: ModuleType) -> bool:
                     break
             return None
 
+        def _prefetch_unlocked(self, page_index: int) -> _Tables | None:
+            # Re-read from the start up to the furthest page requested so far,
+            # keeping the trailing window so later backward reads hit the cache.
+            # Work happens on locals so a failing pass leaves the state intact.
+            upto = max(page_index, self._max_index_seen)
+            cache: OrderedDict[int, _Tables] = OrderedDict()
+            stream = iter(self._stream_factory())
+            found: _Tables | None = None
+            done = True
+            for idx, tables in stream:
+                if idx == page_index:
+                    found = tables
+                cache[idx] = tables
+                if len(cache) > _TABLES_PREFETCH_WINDOW:
+                    cache.popitem(last=False)
+                if idx >= upto:
+                    done = False
+                    break
+            self._stream = stream
+            self._cache = cache
+            self._cache_limit = max(self._cache_limit, _TABLES_PREFETCH_WINDOW)
+            self._max_index_seen = max(self._max_index_seen, max(cache, default=-1))
+            self._done = done
+            self._restarts = 0
+            return found
+
+        def _advance_unlocked(self, page_index: int) -> _Tables | None:
+            cache = self._cache
+            stream = self._stream
+            if stream is None:
+                stream = self._stream = iter(self._stream_factory())
+            while True:
+                try:
+                    idx, tables = next(stream)
+                except StopIteration:
+                    self._done = True
+                    return None
+                cache[idx] = tables
+                cache.move_to_end(idx)
+                if idx > self._max_index_seen:
+                    self._max_index_seen = idx
+                while len(cache) > self._cache_limit:
+                    cache.popitem(last=False)
+                if idx == page_index:
+                    return tables
+
         def get(self, page_index: int) -> _Tables | None:
+            cache = self._cache
+            # Hits skip the lock: OrderedDict operations are atomic under the
+            # GIL, and a concurrent eviction just falls through to the slow path.
+            try:
+                cache.move_to_end(page_index)
+                return cache[page_index]
+            except KeyError:
+                pass
             with self._lock:
-                if page_index in self._cache:
-                    return self._cache[page_index]
-                if page_index < self._max_index_seen or self._done:
-                    return self._get_from_fresh_stream(page_index)
-                while page_index not in self._cache:
-                    try:
-                        idx, tables = next(self._stream)
-                    except StopIteration:
-                        self._done = True
-                        break
-                    self._cache[idx] = tables
-                    if idx > self._max_index_seen:
-                        self._max_index_seen = idx
-                    self._evict_cache(idx)
-                return self._cache.get(page_index)
+                cache = self._cache
+                if page_index in cache:
+                    cache.move_to_end(page_index)
+                    return cache[page_index]
+                if page_index >= self._max_index_seen and not self._done:
+                    return self._advance_unlocked(page_index)
+                # Out-of-order access restarts the native stream each time;
+                # once that keeps happening, rebuild a window of cached pages.
+                # A failed pass is not retried: restarts surface the error at
+                # the page that raises it, as plain restarts always have.
+                if not self._prefetch_failed:
+                    self._restarts += 1
+                    if self._restarts >= _TABLES_PREFETCH_AFTER_RESTARTS:
+                        try:
+                            return self._prefetch_unlocked(page_index)
+                        except _NATIVE_ERRORS:
+                            self._prefetch_failed = True
+            # A restart reads its own fresh stream, so it runs without the lock
+            # and does not hold up threads advancing the shared one.
+            return self._get_from_fresh_stream(page_index)
 
     def _can_use_rust_text(kwargs: dict[str, Any]) -> bool:
         if kwargs.get("auto_rtl") is False:
@@ -386,6 +709,7 @@ def _apply_patch(module: ModuleType) -> bool:
         text_settings: dict[str, Any] | None,
         geometries: Sequence[_PageGeometry],
         page_numbers: Sequence[int] | None,
+        page_index: int | None = None,
     ) -> _BolivarTextStream:
         streams: dict[tuple[object, ...], _BolivarTextStream] | None = None
         if pdf is not None:
@@ -393,13 +717,17 @@ def _apply_patch(module: ModuleType) -> bool:
             if streams is None:
                 streams = {}
                 _set_attr(pdf, "_bolivar_text_streams", streams)
-        settings_key = _settings_key(text_settings)
-        geometries_key = tuple(geometries)
+        # The text kwargs dict is rebuilt on every call, so an identity memo
+        # would never hit; normalize it directly.
+        settings_key = _normalize_key(text_settings)
+        geometries_key = _geometries_key(pdf, geometries, page_index)
         laparams_key = _laparams_key(pdf)
-        page_numbers_key = tuple(page_numbers) if page_numbers is not None else None
+        page_numbers_key = _page_numbers_key(page_numbers)
         key = (settings_key, geometries_key, laparams_key, page_numbers_key)
-        if streams is not None and key in streams:
-            return streams[key]
+        if streams is not None:
+            existing = streams.get(key)
+            if existing is not None:
+                return existing
         rust_doc = getattr(doc, "_rust_doc", None) or doc
 
         def _stream_factory() -> Iterable[_TextStreamItem]:
@@ -421,7 +749,9 @@ def _apply_patch(module: ModuleType) -> bool:
 
         wrapped = _BolivarTextStream(_stream_factory)
         if streams is not None:
-            streams[key] = wrapped
+            # A concurrent caller may have stored a stream for this key first;
+            # keep theirs so both threads share one native iterator.
+            return streams.setdefault(key, wrapped)
         return wrapped
 
     def _get_words_stream(
@@ -430,6 +760,7 @@ def _apply_patch(module: ModuleType) -> bool:
         text_settings: dict[str, Any] | None,
         geometries: Sequence[_PageGeometry],
         page_numbers: Sequence[int] | None,
+        page_index: int | None = None,
     ) -> _BolivarWordsStream:
         streams: dict[tuple[object, ...], _BolivarWordsStream] | None = None
         if pdf is not None:
@@ -437,13 +768,15 @@ def _apply_patch(module: ModuleType) -> bool:
             if streams is None:
                 streams = {}
                 _set_attr(pdf, "_bolivar_words_streams", streams)
-        settings_key = _settings_key(text_settings)
-        geometries_key = tuple(geometries)
+        settings_key = _normalize_key(text_settings)
+        geometries_key = _geometries_key(pdf, geometries, page_index)
         laparams_key = _laparams_key(pdf)
-        page_numbers_key = tuple(page_numbers) if page_numbers is not None else None
+        page_numbers_key = _page_numbers_key(page_numbers)
         key = (settings_key, geometries_key, laparams_key, page_numbers_key)
-        if streams is not None and key in streams:
-            return streams[key]
+        if streams is not None:
+            existing = streams.get(key)
+            if existing is not None:
+                return existing
         rust_doc = getattr(doc, "_rust_doc", None) or doc
 
         def _stream_factory() -> Iterable[_WordsStreamItem]:
@@ -465,7 +798,7 @@ def _apply_patch(module: ModuleType) -> bool:
 
         wrapped = _BolivarWordsStream(_stream_factory)
         if streams is not None:
-            streams[key] = wrapped
+            return streams.setdefault(key, wrapped)
         return wrapped
 
     def _get_table_stream(
@@ -474,28 +807,25 @@ def _apply_patch(module: ModuleType) -> bool:
         table_settings: dict[str, Any] | None,
         geometries: Sequence[_PageGeometry],
         page_numbers: Sequence[int] | None,
+        page_index: int | None = None,
     ) -> _BolivarTablesStream:
-        streams: dict[tuple[object, ...], _BolivarTablesStream] | None = None
+        streams: OrderedDict[tuple[object, ...], _BolivarTablesStream] | None = None
         if pdf is not None:
             streams = getattr(pdf, "_bolivar_table_streams", None)
             if streams is None:
-                streams = {}
+                streams = OrderedDict()
                 _set_attr(pdf, "_bolivar_table_streams", streams)
-        settings_key = _settings_key(table_settings)
-        geometries_key: object
-        if (
-            pdf is not None
-            and geometries is getattr(pdf, "_bolivar_table_geom_base", None)
-            and hasattr(pdf, "_bolivar_table_geom_base_key")
-        ):
-            geometries_key = pdf._bolivar_table_geom_base_key
-        else:
-            geometries_key = tuple(geometries)
+        settings_key = _settings_key(pdf, table_settings)
+        geometries_key = _geometries_key(pdf, geometries, page_index)
         laparams_key = _laparams_key(pdf)
-        page_numbers_key = tuple(page_numbers) if page_numbers is not None else None
+        page_numbers_key = _page_numbers_key(page_numbers)
         key = (settings_key, geometries_key, laparams_key, page_numbers_key)
-        if streams is not None and key in streams:
-            return streams[key]
+        if streams is not None:
+            existing = streams.get(key)
+            if existing is not None:
+                with suppress(KeyError):
+                    streams.move_to_end(key)
+                return existing
         rust_doc = getattr(doc, "_rust_doc", None) or doc
 
         def _stream_factory() -> Iterable[_TablesStreamItem]:
@@ -517,7 +847,13 @@ def _apply_patch(module: ModuleType) -> bool:
 
         wrapped = _BolivarTablesStream(_stream_factory)
         if streams is not None:
-            streams[key] = wrapped
+            stored = streams.setdefault(key, wrapped)
+            # Each settings/geometry combination keeps its own stream and
+            # cached tables, so drop the least recently used ones.
+            while len(streams) > _TABLE_STREAMS_LIMIT:
+                with suppress(KeyError):
+                    streams.popitem(last=False)
+            return stored
         return wrapped
 
     if not already_patched:
@@ -528,7 +864,10 @@ def _apply_patch(module: ModuleType) -> bool:
             page: _PageLike,
             table_settings: dict[str, Any] | None = None,
         ) -> _Tables:
-            if not getattr(page, "is_original", True):
+            # is_original is a class attribute on pdfplumber pages, so it has
+            # to go through getattr; everything else is read into locals once.
+            force_crop = not getattr(page, "is_original", True)
+            if force_crop:
                 return cast(
                     "_Tables",
                     _extract_tables_from_page_objects(
@@ -537,27 +876,32 @@ def _apply_patch(module: ModuleType) -> bool:
                         page.mediabox,
                         page.initial_doctop,
                         table_settings=table_settings,
-                        force_crop=not getattr(page, "is_original", True),
+                        force_crop=force_crop,
                     ),
                 )
-            page_index = getattr(page.page_obj, "_page_index", page.page_number - 1)
-            pdf = page.pdf
-            doc: _DocLike | None = pdf.doc if pdf else None
-            if doc is None:
-                doc = getattr(page.page_obj, "doc", None)
+            page_index, doc = _page_target(page)
             if doc is None:
                 raise PdfminerException("pdf document missing")
+            pdf = page.pdf
             base_geoms = _get_base_geometries(pdf, doc)
-            geoms = _build_geometries(doc, page_index, page, base=base_geoms)
-            try:
-                stream = _get_table_stream(
-                    pdf, doc, table_settings, geoms, page_numbers=None
-                )
-                tables = stream.get(page_index)
-                if tables is not None:
-                    return tables
-            except AttributeError:
-                pass
+            # A stream only pays off when later pages can reuse it, so
+            # single-page documents go straight to the indexed call.
+            if len(base_geoms) > 1:
+                geoms = _build_geometries(doc, page_index, page, base=base_geoms)
+                try:
+                    stream = _get_table_stream(
+                        pdf,
+                        doc,
+                        table_settings,
+                        geoms,
+                        page_numbers=None,
+                        page_index=page_index,
+                    )
+                    tables = stream.get(page_index)
+                    if tables is not None:
+                        return tables
+                except AttributeError:
+                    pass
             rust_doc = getattr(doc, "_rust_doc", None) or doc
             native_doc = cast("_NativePDFDocument", rust_doc)
             try:
@@ -566,9 +910,7 @@ def _apply_patch(module: ModuleType) -> bool:
                     page_index,
                     _page_geom(page),
                     table_settings=table_settings,
-                    laparams=(
-                        getattr(pdf, "laparams", None) if pdf is not None else None
-                    ),
+                    laparams=getattr(pdf, "laparams", None),
                     caching=getattr(doc, "caching", True),
                 )
                 return cast("_Tables", tables)
@@ -581,29 +923,26 @@ def _apply_patch(module: ModuleType) -> bool:
                         page.mediabox,
                         page.initial_doctop,
                         table_settings=table_settings,
-                        force_crop=not getattr(page, "is_original", True),
+                        force_crop=force_crop,
                     ),
                 )
 
-        def _extract_tables(
-            self: _PageLike, table_settings: dict[str, Any] | None = None
-        ) -> _Tables:
-            return extract_tables_from_page(self, table_settings)
-
         def _table_cell_count(table: _Table) -> int:
-            return sum(len(row) for row in table)
+            return sum(map(len, table))
 
         def _extract_table(
             self: _PageLike,
             table_settings: dict[str, Any] | None = None,
         ) -> _Table | None:
-            tables = _extract_tables(self, table_settings=table_settings)
+            tables = extract_tables_from_page(self, table_settings=table_settings)
             if not tables:
                 return None
+            if len(tables) == 1:
+                return tables[0]
             return max(tables, key=_table_cell_count)
 
-        _mark_patched(_extract_tables)
-        _set_attr(page_mod.Page, "extract_tables", _extract_tables)
+        _mark_patched(extract_tables_from_page)
+        _set_attr(page_mod.Page, "extract_tables", extract_tables_from_page)
         _mark_patched(_extract_table)
         _set_attr(page_mod.Page, "extract_table", _extract_table)
 
@@ -616,18 +955,15 @@ def _apply_patch(module: ModuleType) -> bool:
             if not _can_use_rust_text(text_kwargs):
                 return cast("str", _orig_extract_text(self, **kwargs))
             text_kwargs.pop("auto_rtl", None)
-            page_index = getattr(self.page_obj, "_page_index", self.page_number - 1)
-            pdf = self.pdf
-            doc: _DocLike | None = pdf.doc if pdf else None
-            if doc is None:
-                doc = getattr(self.page_obj, "doc", None)
+            page_index, doc = _page_target(self)
             if doc is None:
                 return cast("str", _orig_extract_text(self, **kwargs))
+            pdf = self.pdf
             base_geoms = _get_base_geometries(pdf, doc)
             geoms = _build_geometries(doc, page_index, self, base=base_geoms)
-            page_numbers = [page_index]
+            page_numbers = (page_index,)
             stream = _get_text_stream(
-                pdf, doc, text_kwargs or None, geoms, page_numbers
+                pdf, doc, text_kwargs or None, geoms, page_numbers, page_index
             )
             text = stream.get(page_index)
             if text is None:
@@ -649,18 +985,15 @@ def _apply_patch(module: ModuleType) -> bool:
                 return cast("_Words", _orig_extract_words(self, **kwargs))
             word_kwargs.pop("return_chars", None)
             word_kwargs.pop("extra_attrs", None)
-            page_index = getattr(self.page_obj, "_page_index", self.page_number - 1)
-            pdf = self.pdf
-            doc: _DocLike | None = pdf.doc if pdf else None
-            if doc is None:
-                doc = getattr(self.page_obj, "doc", None)
+            page_index, doc = _page_target(self)
             if doc is None:
                 return cast("_Words", _orig_extract_words(self, **kwargs))
+            pdf = self.pdf
             base_geoms = _get_base_geometries(pdf, doc)
             geoms = _build_geometries(doc, page_index, self, base=base_geoms)
-            page_numbers = [page_index]
+            page_numbers = (page_index,)
             stream = _get_words_stream(
-                pdf, doc, word_kwargs or None, geoms, page_numbers
+                pdf, doc, word_kwargs or None, geoms, page_numbers, page_index
             )
             words = stream.get(page_index)
             return words or []
@@ -670,7 +1003,23 @@ def _apply_patch(module: ModuleType) -> bool:
         _mark_patched(_extract_words)
         _set_attr(page_mod.Page, "extract_words", _extract_words)
 
+    _PAGE_CACHE_LIMIT = _env_positive_int("BOLIVAR_PAGE_CACHE", 32)
+    _ASYNC_PREFETCH_PAGES = _env_positive_int("BOLIVAR_ASYNC_PREFETCH_PAGES", 4)
+
     class BolivarLazyPages(list[object]):
+        # Stays a list subclass for isinstance checks; slots still apply to
+        # the attributes added here and drop the per-instance __dict__.
+        __slots__ = (
+            "_doc",
+            "_doctops",
+            "_page_cache",
+            "_page_cache_limit",
+            "_page_number_set",
+            "_page_numbers",
+            "_pdf",
+            "_prefetch_pages",
+        )
+
         def __init__(self, pdf: _PdfLike) -> None:
             self._pdf = pdf
             doc = pdf.doc if pdf is not None else None
@@ -681,16 +1030,22 @@ def _apply_patch(module: ModuleType) -> bool:
             if page_count <= 0:
                 raise PdfminerException("PDF contains no pages")
             pages_to_parse = pdf.pages_to_parse
+            # Unfiltered documents answer membership with a range; a subset
+            # builds its frozenset on the first __contains__ call.
+            self._page_number_set: range | frozenset[int] | None
             if pages_to_parse is None:
                 self._page_numbers = list(range(page_count))
+                self._page_number_set = range(page_count)
             else:
                 allowed = set(pages_to_parse)
                 self._page_numbers = [
                     idx for idx in range(page_count) if (idx + 1) in allowed
                 ]
-            self._page_number_set = set(self._page_numbers)
-            self._page_cache: dict[int, object] = {}
-            self._doctops: list[float] | None = None
+                self._page_number_set = None
+            self._page_cache: OrderedDict[int, object] = OrderedDict()
+            self._page_cache_limit = _PAGE_CACHE_LIMIT
+            self._prefetch_pages = _ASYNC_PREFETCH_PAGES
+            self._doctops = self._compute_doctops()
 
         def close(self) -> None:
             for page in self._page_cache.values():
@@ -699,21 +1054,19 @@ def _apply_patch(module: ModuleType) -> bool:
                     close_fn()
             self._page_cache.clear()
 
-        def _ensure_doctops(self) -> None:
-            if self._doctops is not None:
-                return
+        def _compute_doctops(self) -> Sequence[float]:
             boxes = _safe_page_mediaboxes(self._doc)
-            doctops: list[float] = []
-            running = 0.0
+            page_numbers = self._page_numbers
+            count = len(page_numbers)
+            # Unfiltered documents select a prefix of the boxes, so skip the
+            # per-page indexing unless pages_to_parse picked a subset.
+            if count <= len(boxes) and (not count or page_numbers[-1] == count - 1):
+                return _running_doctops(boxes[:count])
             try:
-                for page_index in self._page_numbers:
-                    box = boxes[page_index]
-                    height = box[3] - box[1]
-                    doctops.append(running)
-                    running += height
+                selected = [boxes[page_index] for page_index in page_numbers]
             except IndexError as e:
                 raise PdfminerException(str(e)) from e
-            self._doctops = doctops
+            return _running_doctops(selected)
 
         def __len__(self) -> int:
             return len(self._page_numbers)
@@ -728,29 +1081,38 @@ def _apply_patch(module: ModuleType) -> bool:
             self,
             idx: SupportsIndex | _SliceIndex,
         ) -> object | list[object]:
-            if isinstance(idx, slice):
-                return [self[i] for i in range(*idx.indices(len(self)))]
-            try:
-                idx = to_index(idx)
-            except TypeError as e:
-                raise TypeError("page index must be int or slice") from e
+            page_numbers = self._page_numbers
+            count = len(page_numbers)
+            if not isinstance(idx, int):
+                if isinstance(idx, slice):
+                    return [self[i] for i in range(*idx.indices(count))]
+                try:
+                    idx = to_index(idx)
+                except TypeError as e:
+                    raise TypeError("page index must be int or slice") from e
             if idx < 0:
-                idx += len(self)
-            if idx < 0 or idx >= len(self):
+                idx += count
+            if idx < 0 or idx >= count:
                 raise IndexError("page index out of range")
-            self._ensure_doctops()
-            page_index = self._page_numbers[idx]
-            cached = self._page_cache.get(page_index)
+            page_index = page_numbers[idx]
+            # Serve cache hits inline; _page_at handles construction.
+            page_cache = self._page_cache
+            cached = page_cache.get(page_index)
             if cached is not None:
+                page_cache.move_to_end(page_index)
                 return cached
-            assert self._doctops is not None
-            doctops = self._doctops
-            doctop = doctops[idx]
+            return self._page_at(idx, page_index)
+
+        def _page_at(self, idx: int, page_index: int) -> object:
+            page_cache = self._page_cache
+            cached = page_cache.get(page_index)
+            if cached is not None:
+                page_cache.move_to_end(page_index)
+                return cached
+            doctop = self._doctops[idx]
             try:
                 page_obj = self._doc.get_page(page_index)
-            except PdfminerException:
-                raise
-            except Exception as e:
+            except _NATIVE_ERRORS as e:
                 raise PdfminerException(str(e)) from e
             page = page_mod.Page(
                 self._pdf,
@@ -758,49 +1120,108 @@ def _apply_patch(module: ModuleType) -> bool:
                 page_number=page_index + 1,
                 initial_doctop=doctop,
             )
-            self._page_cache[page_index] = page
+            page_cache[page_index] = page
+            while len(page_cache) > self._page_cache_limit:
+                _, evicted = page_cache.popitem(last=False)
+                close_fn = getattr(evicted, "close", None)
+                if callable(close_fn):
+                    close_fn()
             return page
 
+        def _iter_slots(self, slots: Iterable[int]) -> Iterator[object]:
+            # Slots come straight from range(len(self)), so skip the index
+            # coercion and bounds checks __getitem__ does, and serve warm
+            # pages without going through _page_at.
+            page_numbers = self._page_numbers
+            page_cache = self._page_cache
+            page_at = self._page_at
+            for idx in slots:
+                page_index = page_numbers[idx]
+                page = page_cache.get(page_index)
+                if page is None:
+                    page = page_at(idx, page_index)
+                else:
+                    page_cache.move_to_end(page_index)
+                yield page
+
         def __iter__(self) -> Iterator[object]:
-            for i in range(len(self)):
-                yield self[i]
+            return self._iter_slots(range(len(self._page_numbers)))
 
         def __reversed__(self) -> Iterator[object]:
-            for i in range(len(self) - 1, -1, -1):
-                yield self[i]
+            return self._iter_slots(range(len(self._page_numbers) - 1, -1, -1))
 
         def __contains__(self, item: object) -> bool:
             page_number = getattr(item, "page_number", None)
-            if page_number is not None:
-                return (page_number - 1) in self._page_number_set
-            return False
+            if page_number is None:
+                return False
+            number_set = self._page_number_set
+            if number_set is None:
+                number_set = frozenset(self._page_numbers)
+                self._page_number_set = number_set
+            return (page_number - 1) in number_set
 
         def __aiter__(self) -> AsyncIterator[object]:
             async def gen() -> AsyncIterator[object]:
                 # Keep async iteration lightweight.
                 # Avoid eager layout extraction to cap memory.
-                self._ensure_doctops()
-                page_numbers = list(self._page_numbers)
-                doctops = list(self._doctops or [])
-                for idx, page_index in enumerate(page_numbers):
-                    cached = self._page_cache.get(page_index)
-                    if cached is not None:
-                        page = cached
-                    else:
+                # Load page handles a window at a time on a worker thread,
+                # keeping the next window in flight while this one is consumed.
+                page_numbers = self._page_numbers
+                doctops = self._doctops
+                get_page = self._doc.get_page
+                get_pages_batch = self._doc.get_pages_batch
+                window = self._prefetch_pages
+
+                def fetch(start: int) -> asyncio.Task[Sequence[object]] | None:
+                    if start >= len(page_numbers):
+                        return None
+                    chunk = page_numbers[start : start + window]
+                    return asyncio.create_task(
+                        asyncio.to_thread(get_pages_batch, chunk)
+                    )
+
+                start = 0
+                pending = fetch(start)
+                try:
+                    while pending is not None:
+                        current = pending
+                        pending = fetch(start + window)
+                        page_objs: Sequence[object | None]
                         try:
-                            page_obj = self._doc.get_page(page_index)
-                        except PdfminerException:
-                            raise
-                        except Exception as e:
-                            raise PdfminerException(str(e)) from e
-                        doctop = doctops[idx] if idx < len(doctops) else 0.0
-                        page = page_mod.Page(
-                            self._pdf,
-                            page_obj,
-                            page_number=page_index + 1,
-                            initial_doctop=doctop,
-                        )
-                    yield page
+                            page_objs = await current
+                        except _NATIVE_ERRORS:
+                            # A batch fails as a whole; load its pages one by
+                            # one so earlier pages are still yielded and the
+                            # error is raised at the page that caused it.
+                            page_objs = [None] * min(window, len(page_numbers) - start)
+                        for idx, page_obj in enumerate(page_objs, start):
+                            page_index = page_numbers[idx]
+                            cached = self._page_cache.get(page_index)
+                            if cached is not None:
+                                yield cached
+                                continue
+                            if page_obj is None:
+                                try:
+                                    page_obj = await asyncio.to_thread(
+                                        get_page, page_index
+                                    )
+                                except _NATIVE_ERRORS as e:
+                                    raise PdfminerException(str(e)) from e
+                            yield page_mod.Page(
+                                self._pdf,
+                                page_obj,
+                                page_number=page_index + 1,
+                                initial_doctop=doctops[idx],
+                            )
+                        start += window
+                finally:
+                    if pending is not None:
+                        if not pending.done():
+                            pending.cancel()
+                        elif not pending.cancelled():
+                            # Retrieve the outcome so a failed prefetch is not
+                            # reported as an unretrieved task exception.
+                            pending.exception()
 
             return gen()
 
@@ -813,6 +1234,8 @@ def _apply_patch(module: ModuleType) -> bool:
     else:
         pdf_mod = _pdf_mod
 
+    # Only consider patch complete when PDF.pages is patched
+    pdf_pages_patched = False
     if pdf_mod is not None and hasattr(pdf_mod, "PDF"):
         pdf_cls = pdf_mod.PDF
         current_pages = getattr(pdf_cls, "pages", None)
@@ -833,6 +1256,7 @@ def _apply_patch(module: ModuleType) -> bool:
 
             _mark_patched(_bolivar_pages)
             _set_attr(pdf_cls, "pages", property(_bolivar_pages))
+        pdf_pages_patched = True
 
         current_close = getattr(pdf_cls, "close", None)
         if current_close is None or not getattr(
@@ -872,20 +1296,6 @@ def _apply_patch(module: ModuleType) -> bool:
             _set_attr(pdf_cls, "__aenter__", _aenter)
             _set_attr(pdf_cls, "__aexit__", _aexit)
 
-    # Check if PDF.pages was successfully patched
-    pdf_pages_patched = False
-    try:
-        import pdfplumber.pdf as _check_pdf
-
-        if hasattr(_check_pdf, "PDF"):
-            _pages_prop = getattr(_check_pdf.PDF, "pages", None)
-            if isinstance(_pages_prop, property) and getattr(
-                _pages_prop.fget, "_bolivar_patched", False
-            ):
-                pdf_pages_patched = True
-    except Exception:
-        pass
-
     # Patch pdfplumber.repair to use Rust repair
     repair_mod: ModuleType | None
     try:
@@ -895,16 +1305,14 @@ def _apply_patch(module: ModuleType) -> bool:
     else:
         repair_mod = _repair_mod
 
-    if repair_mod is not None:
-        from bolivar import repair_pdf
+    if repair_mod is not None and not getattr(
+        getattr(repair_mod, "_repair", None), "_bolivar_patched", False
+    ):
+
+        def _rust_repair_bytes(path_or_fp: _RepairInput) -> bytes:
+            # Resolved on first repair so patching never loads the extension.
+            from bolivar import repair_pdf
 
-        def _rust_repair(
-            path_or_fp: _RepairInput,
-            password: str | None = None,
-            gs_path: object = None,
-            setting: str = "default",
-        ) -> BytesIO:
-            del password, gs_path, setting
             payload: bytes | bytearray
             if isinstance(path_or_fp, (bytes, bytearray)):
                 payload = path_or_fp
@@ -913,7 +1321,16 @@ def _apply_patch(module: ModuleType) -> bool:
                     payload = f.read()
             else:
                 payload = path_or_fp.read()
-            return BytesIO(repair_pdf(payload))
+            return repair_pdf(payload)
+
+        def _rust_repair(
+            path_or_fp: _RepairInput,
+            password: str | None = None,
+            gs_path: object = None,
+            setting: str = "default",
+        ) -> BytesIO:
+            del password, gs_path, setting
+            return BytesIO(_rust_repair_bytes(path_or_fp))
 
         def _rust_repair_public(
             path_or_fp: _RepairInput,
@@ -922,33 +1339,38 @@ def _apply_patch(module: ModuleType) -> bool:
             gs_path: object = None,
             setting: str = "default",
         ) -> BytesIO | None:
-            repaired = _rust_repair(
-                path_or_fp,
-                password=password,
-                gs_path=gs_path,
-                setting=setting,
-            )
+            del password, gs_path, setting
+            repaired = _rust_repair_bytes(path_or_fp)
             if outfile is not None:
+                # Write the native bytes as-is rather than copying them back
+                # out of a BytesIO.
                 with open(outfile, "wb") as f:
-                    f.write(repaired.read())
+                    f.write(repaired)
                 return None
-            return repaired
+            return BytesIO(repaired)
 
+        _mark_patched(_rust_repair)
+        _mark_patched(_rust_repair_public)
         _set_attr(repair_mod, "_repair", _rust_repair)
         _set_attr(repair_mod, "repair", _rust_repair_public)
+
+    if repair_mod is not None:
+        # Later patch runs reuse the installed functions and only reach the
+        # modules that loaded since.
         if hasattr(module, "repair"):
-            _set_attr(module, "repair", _rust_repair_public)
+            _set_attr(module, "repair", repair_mod.repair)
         pdf_mod = _module_from_sys("pdfplumber.pdf")
         if pdf_mod is not None and hasattr(pdf_mod, "_repair"):
-            _set_attr(pdf_mod, "_repair", _rust_repair)
+            _set_attr(pdf_mod, "_repair", repair_mod._repair)
 
-    # Only consider patch complete when PDF.pages is patched
     return pdf_pages_patched
 
 
-_HOOK_INSTALLED = False
 _HOOK_LOCK = threading.Lock()
 _PATCH_APPLIED = False
+# The pdfplumber package object last patched successfully. A re-imported
+# package is a new object, so identity tells whether it still needs patching.
+_PATCHED_PACKAGE: ModuleType | None = None
 _logger = logging.getLogger("bolivar.pdfplumber_patch")
 
 
@@ -965,23 +1387,37 @@ class _PdfplumberPatchLoader(importlib.abc.Loader):
         return None
 
     def exec_module(self, module: ModuleType) -> None:
-        global _PATCH_APPLIED
+        global _PATCH_APPLIED, _PATCHED_PACKAGE
         self.loader.exec_module(module)
+        # Unlocked read first: once set, the flag stays set, so later
+        # pdfplumber submodule imports skip the lock entirely.
+        if _PATCH_APPLIED:
+            return
         with _HOOK_LOCK:
             if _PATCH_APPLIED:
                 return
+            # Take the finder off meta_path while patching so pdfplumber
+            # imports made by _apply_patch cannot re-enter this lock.
+            finder = _INSTALLED_FINDER
+            names = finder.names if finder is not None else frozenset()
+            _remove_hook_unlocked()
             try:
-                if _apply_patch(module):
-                    _PATCH_APPLIED = True
-                    _remove_hook_unlocked()  # Only remove hook after successful patch
+                patched = _apply_patch(module)
             except Exception as e:
+                # Leave the hook off on error to prevent infinite retries.
                 _logger.warning("Failed to apply bolivar patch to pdfplumber: %s", e)
-                _remove_hook_unlocked()  # Remove on error to prevent infinite retries
+                return
+            if patched:
+                _PATCH_APPLIED = True
+                _PATCHED_PACKAGE = _module_from_sys("pdfplumber")
+            elif names:
+                # Incomplete patch: retry when the next watched module loads.
+                _install_hook_unlocked(names)
 
 
 class _PdfplumberPatchFinder(importlib.abc.MetaPathFinder):
     def __init__(self, names: Iterable[str]) -> None:
-        self.names = set(names)
+        self.names = frozenset(names)
 
     def find_spec(
         self,
@@ -990,7 +1426,13 @@ class _PdfplumberPatchFinder(importlib.abc.MetaPathFinder):
         target: ModuleType | None = None,
     ) -> importlib.machinery.ModuleSpec | None:
         del target
-        if fullname not in self.names:
+        # Nearly every import is unrelated, so a prefix compare rejects it
+        # before the set lookup.
+        if (
+            _PATCH_APPLIED
+            or not fullname.startswith("pdfplumber")
+            or fullname not in self.names
+        ):
             return None
         spec = importlib.machinery.PathFinder.find_spec(fullname, path)
         if spec is None or spec.loader is None:
@@ -999,30 +1441,42 @@ class _PdfplumberPatchFinder(importlib.abc.MetaPathFinder):
         return spec
 
 
+_INSTALLED_FINDER: _PdfplumberPatchFinder | None = None
+
+
 def _install_hook(names: set[str] | None = None) -> None:
-    global _HOOK_INSTALLED
+    # Double-checked locking: once the patch is applied the flag never goes
+    # back to False, so an unlocked read can skip the lock. Anything else is
+    # re-checked under it.
+    if _PATCH_APPLIED:
+        return
     if names is None:
         names = {"pdfplumber", "pdfplumber.page", "pdfplumber.pdf"}
     with _HOOK_LOCK:
         if _PATCH_APPLIED:
             return
-        if _HOOK_INSTALLED:
-            for finder in sys.meta_path:
-                if isinstance(finder, _PdfplumberPatchFinder):
-                    finder.names.update(names)
-            return
-        sys.meta_path.insert(0, _PdfplumberPatchFinder(names))
-        _HOOK_INSTALLED = True
+        _install_hook_unlocked(names)
+
+
+def _install_hook_unlocked(names: Iterable[str]) -> None:
+    global _INSTALLED_FINDER
+    if _INSTALLED_FINDER is not None:
+        _INSTALLED_FINDER.names = _INSTALLED_FINDER.names.union(names)
+        return
+    finder = _PdfplumberPatchFinder(names)
+    sys.meta_path.insert(0, finder)
+    _INSTALLED_FINDER = finder
 
 
 def _remove_hook_unlocked() -> None:
-    global _HOOK_INSTALLED
-    if not _HOOK_INSTALLED:
+    global _INSTALLED_FINDER
+    finder = _INSTALLED_FINDER
+    if finder is None:
         return
-    sys.meta_path = [
-        m for m in sys.meta_path if not isinstance(m, _PdfplumberPatchFinder)
-    ]
-    _HOOK_INSTALLED = False
+    # Stale references (e.g. a copied meta_path) then match nothing.
+    finder.names = frozenset()
+    sys.meta_path = [m for m in sys.meta_path if m is not finder]
+    _INSTALLED_FINDER = None
 
 
 def _remove_hook() -> None:
@@ -1031,9 +1485,15 @@ def _remove_hook() -> None:
 
 
 def patch_pdfplumber() -> bool:
+    global _PATCHED_PACKAGE
     module = _module_from_sys("pdfplumber")
+    if module is not None and module is _PATCHED_PACKAGE:
+        return True
     if module is not None and hasattr(module, "page"):
-        return _apply_patch(module)
+        patched = _apply_patch(module)
+        if patched:
+            _PATCHED_PACKAGE = module
+        return patched
 
     if module is not None:
         _install_hook({"pdfplumber.page", "pdfplumber.pdf"})
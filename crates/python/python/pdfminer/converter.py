@@ -4,7 +4,6 @@
 # pdfplumber subclasses it as PDFPageAggregatorWithMarkedContent.
 
 import io
-import re
 from collections.abc import Sequence
 from typing import Protocol, TypeAlias
 
@@ -137,41 +136,44 @@ class PDFLayoutAnalyzer:
         """Paint paths described in section 4.4 of the PDF reference manual."""
         if not path:
             return
-        shape = "".join(str(x[0]) for x in path)
-
-        if shape[:1] != "m":
+        operators = [str(operation[0]) for operation in path]
+        if operators[0] != "m":
             return
-        if shape.count("m") > 1:
-            for m in re.finditer(r"m[^m]+", shape):
-                subpath = path[m.start(0) : m.end(0)]
-                self.paint_path(gstate, stroke, fill, evenodd, subpath)
+        starts = [i for i, op in enumerate(operators) if op == "m"]
+        if len(starts) > 1:
+            # Paint each "m"-led subpath; a bare "m" with no segments is skipped.
+            ends = [*starts[1:], len(path)]
+            for start, end in zip(starts, ends, strict=True):
+                if end - start > 1:
+                    self.paint_path(gstate, stroke, fill, evenodd, path[start:end])
             return
 
-        # Points for each operation (h uses starting point).
-        raw_pts = [
-            (float(p[-2]), float(p[-1]))
-            if p[0] != "h"
-            else (float(path[0][-2]), float(path[0][-1]))
-            for p in path
-        ]
-        pts = [apply_matrix_pt(self.ctm, pt) for pt in raw_pts]
-
-        operators = [str(operation[0]) for operation in path]
+        ctm = self.ctm
         transformed_points = [
             [
-                apply_matrix_pt(self.ctm, (float(a), float(b)))
+                apply_matrix_pt(ctm, (float(a), float(b)))
                 for a, b in zip(operation[1::2], operation[2::2], strict=False)
             ]
             for operation in path
         ]
+        # Points for each operation: its final operand pair, already transformed
+        # above (h uses starting point).
+        start = transformed_points[0][-1]
+        pts = [
+            points[-1] if op != "h" else start
+            for op, points in zip(operators, transformed_points, strict=False)
+        ]
         transformed_path = [
             (o, *p) for o, p in zip(operators, transformed_points, strict=False)
         ]
 
         # Drop redundant "l" on a path closed with "h".
-        if len(shape) > 3 and shape[-2:] == "lh" and pts[-2] == pts[0]:
-            shape = shape[:-2] + "h"
+        if len(operators) > 3 and operators[-2:] == ["l", "h"] and pts[-2] == pts[0]:
+            del operators[-2]
             pts.pop()
+        # Only paths of up to five operations can be lines or rectangles, so
+        # longer ones skip building the shape string.
+        shape = "".join(operators) if len(operators) <= 5 else ""
 
         if shape in {"mlh", "ml"}:
             line = LTLine(
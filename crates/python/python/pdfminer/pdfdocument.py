@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 from bolivar import PDFDocument as _RustPDFDocument
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
     from bolivar._bolivar import PDFDocument as _NativePDFDocument
 
@@ -142,6 +142,16 @@ class PDFDocument:
         rust_page = self._rust_doc.get_page(index)
         return PDFPage(rust_page, self, page_index=index)
 
+    def get_pages_batch(self, indices: Sequence[int]) -> list[object]:
+        """Return the PDFPages at ``indices`` from a single native call."""
+        from .pdfpage import PDFPage
+
+        rust_pages = self._rust_doc.get_pages_batch(list(indices))
+        return [
+            PDFPage(rust_page, self, page_index=index)
+            for rust_page, index in zip(rust_pages, indices, strict=True)
+        ]
+
 
 class PDFNoOutlines(PDFException):
     pass
@@ -13,11 +13,11 @@ use memmap2::Mmap;
 use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict, PyList, PySequence, PyTuple, PyType};
+use pyo3::types::{PyBytes, PyDict, PyInt, PyList, PySequence, PyTuple, PyType};
 use std::collections::{HashMap, HashSet};
 use std::fs::File;
 use std::slice;
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 
 use crate::convert::{
     intern_pskeyword, intern_psliteral, pdf_object_to_py, pdf_object_to_py_internal,
@@ -127,59 +127,69 @@ fn resolve_pdf_obj(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>
 }
 
 /// Parse a number tree from a PDF object.
-fn parse_number_tree(
-    py: Python<'_>,
-    obj: &Bound<'_, PyAny>,
+///
+/// Walks the tree with an explicit stack so deeply nested Kids chains cannot
+/// overflow the native stack; entries come out in the same depth-first order
+/// as a recursive walk.
+fn parse_number_tree<'py>(
+    py: Python<'py>,
+    root: &Bound<'py, PyAny>,
     visited: &mut HashSet<i64>,
     out: &mut Vec<(i64, Py<PyAny>)>,
 ) -> PyResult<()> {
-    if is_pdf_obj_ref(obj)?
-        && let Ok(objid) = obj.getattr("objid")?.extract::<i64>()
-    {
-        if visited.contains(&objid) {
-            return Ok(());
+    let mut stack = vec![root.clone()];
+    while let Some(obj) = stack.pop() {
+        if is_pdf_obj_ref(&obj)?
+            && let Ok(objid) = obj.getattr("objid")?.extract::<i64>()
+            && !visited.insert(objid)
+        {
+            continue;
         }
-        visited.insert(objid);
-    }
-
-    let resolved = resolve_pdf_obj(py, obj)?;
-    let resolved = resolved.bind(py);
-    if resolved.is_none() {
-        return Ok(());
-    }
-
-    let dict = match resolved.cast::<PyDict>() {
-        Ok(d) => d,
-        Err(_) => return Ok(()),
-    };
-
-    if let Some(nums_obj) = dict.get_item("Nums")? {
-        let nums_resolved = resolve_pdf_obj(py, &nums_obj)?;
-        let nums = nums_resolved.bind(py);
-        if let Ok(seq) = nums.cast::<PySequence>() {
-            let len = seq.len().unwrap_or(0);
-            let mut idx = 0;
-            while idx + 1 < len {
-                let key_obj = seq.get_item(idx)?;
-                let key_resolved = resolve_pdf_obj(py, &key_obj)?;
-                let key_bound = key_resolved.bind(py);
-                if let Ok(key_val) = key_bound.extract::<i64>() {
-                    let val_obj = seq.get_item(idx + 1)?;
-                    out.push((key_val, val_obj.into_any().unbind()));
+
+        let resolved = resolve_pdf_obj(py, &obj)?;
+        let resolved = resolved.bind(py);
+        if resolved.is_none() {
+            continue;
+        }
+
+        let dict = match resolved.cast::<PyDict>() {
+            Ok(d) => d,
+            Err(_) => continue,
+        };
+
+        if let Some(nums_obj) = dict.get_item("Nums")? {
+            let nums_resolved = resolve_pdf_obj(py, &nums_obj)?;
+            let nums = nums_resolved.bind(py);
+            if let Ok(seq) = nums.cast::<PySequence>() {
+                let len = seq.len().unwrap_or(0);
+                let mut idx = 0;
+                while idx + 1 < len {
+                    let key_obj = seq.get_item(idx)?;
+                    // Keys are nearly always inline integers; only other
+                    // objects pay for the reference probe and resolve call.
+                    let key = if key_obj.is_instance_of::<PyInt>() {
+                        key_obj.extract::<i64>()
+                    } else {
+                        resolve_pdf_obj(py, &key_obj)?.bind(py).extract::<i64>()
+                    };
+                    if let Ok(key_val) = key {
+                        let val_obj = seq.get_item(idx + 1)?;
+                        out.push((key_val, val_obj.into_any().unbind()));
+                    }
+                    idx += 2;
                 }
-                idx += 2;
             }
         }
-    }
 
-    if let Some(kids_obj) = dict.get_item("Kids")? {
-        let kids_resolved = resolve_pdf_obj(py, &kids_obj)?;
-        let kids = kids_resolved.bind(py);
-        if let Ok(seq) = kids.cast::<PySequence>() {
-            let len = seq.len().unwrap_or(0);
-            for idx in 0..len {
-                let kid = seq.get_item(idx)?;
-                parse_number_tree(py, &kid, visited, out)?;
+        if let Some(kids_obj) = dict.get_item("Kids")? {
+            let kids_resolved = resolve_pdf_obj(py, &kids_obj)?;
+            let kids = kids_resolved.bind(py);
+            if let Ok(seq) = kids.cast::<PySequence>() {
+                let len = seq.len().unwrap_or(0);
+                // Pushed in reverse so the first kid is visited next.
+                for idx in (0..len).rev() {
+                    stack.push(seq.get_item(idx)?);
+                }
             }
         }
     }
@@ -187,25 +197,35 @@ fn parse_number_tree(
     Ok(())
 }
 
+/// Number tree entries parsed once, with their positions ordered by key.
+struct ParsedNumberTree {
+    entries: Vec<(i64, Py<PyAny>)>,
+    by_key: Vec<usize>,
+}
+
 /// Number tree for PDF name/number trees.
 #[pyclass(name = "NumberTree")]
 pub struct PyNumberTree {
     obj: Py<PyAny>,
+    parsed: OnceLock<ParsedNumberTree>,
 }
 
 #[pymethods]
 impl PyNumberTree {
     #[new]
     pub fn new(obj: Py<PyAny>) -> Self {
-        Self { obj }
+        Self {
+            obj,
+            parsed: OnceLock::new(),
+        }
     }
 
     #[getter]
     fn values(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        let vals = self.compute_values(py)?;
+        let parsed = self.parsed(py)?;
         let list = PyList::empty(py);
-        for (k, v) in vals {
-            let k_obj = k.into_pyobject(py)?.into_any().unbind();
+        for (k, v) in &parsed.entries {
+            let k_obj = (*k).into_pyobject(py)?.into_any().unbind();
             let tup = PyTuple::new(py, [k_obj, v.clone_ref(py)])?;
             list.append(tup)?;
         }
@@ -213,16 +233,13 @@ impl PyNumberTree {
     }
 
     fn lookup(&self, py: Python<'_>, key: i64) -> PyResult<Py<PyAny>> {
-        let vals = self.compute_values(py)?;
-        for (k, v) in vals {
-            if k == key {
-                return Ok(v);
-            }
-            if k > key {
-                break;
-            }
+        let parsed = self.parsed(py)?;
+        let entries = &parsed.entries;
+        let pos = parsed.by_key.partition_point(|&i| entries[i].0 < key);
+        match parsed.by_key.get(pos) {
+            Some(&i) if entries[i].0 == key => Ok(entries[i].1.clone_ref(py)),
+            _ => Ok(py.None()),
         }
-        Ok(py.None())
     }
 
     fn __iter__(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
@@ -236,12 +253,22 @@ impl PyNumberTree {
 }
 
 impl PyNumberTree {
-    fn compute_values(&self, py: Python<'_>) -> PyResult<Vec<(i64, Py<PyAny>)>> {
+    /// Parse the tree on first use; later lookups reuse the entries and
+    /// binary-search them by key.
+    fn parsed(&self, py: Python<'_>) -> PyResult<&ParsedNumberTree> {
+        if let Some(parsed) = self.parsed.get() {
+            return Ok(parsed);
+        }
         let mut visited = HashSet::new();
-        let mut out = Vec::new();
+        let mut entries = Vec::new();
         let obj = self.obj.bind(py);
-        parse_number_tree(py, obj, &mut visited, &mut out)?;
-        Ok(out)
+        parse_number_tree(py, obj, &mut visited, &mut entries)?;
+        // Stable, so duplicate keys still resolve to the first entry.
+        let mut by_key: Vec<usize> = (0..entries.len()).collect();
+        by_key.sort_by_key(|&i| entries[i].0);
+        // A concurrent first call may have stored its result already; both
+        // parses are equivalent, so keep whichever landed first.
+        Ok(self.parsed.get_or_init(|| ParsedNumberTree { entries, by_key }))
     }
 }
 
@@ -648,11 +675,39 @@ impl PyPDFDocument {
     fn get_page(slf: PyRef<'_, Self>, py: Python<'_>, index: usize) -> PyResult<PyPDFPage> {
         // Safety: slf is a valid, live Python object for the duration of this call.
         let py_doc = unsafe { Py::<PyAny>::from_borrowed_ptr(py, slf.as_ptr()) };
-        let page = slf
-            .inner
-            .get_page_cached(index)
+        let inner = Arc::clone(&slf.inner);
+        let page = py
+            .detach(|| inner.get_page_cached(index))
             .map_err(|e| PyValueError::new_err(format!("Failed to get page {}: {}", index, e)))?;
-        PyPDFPage::from_core(py, page, Arc::clone(&slf.inner), Some(&py_doc))
+        PyPDFPage::from_core(py, page, inner, Some(&py_doc))
+    }
+
+    /// Get several pages by index in one call.
+    ///
+    /// The pages are loaded with the GIL released and returned in the order
+    /// of `indices`.
+    fn get_pages_batch(
+        slf: PyRef<'_, Self>,
+        py: Python<'_>,
+        indices: Vec<usize>,
+    ) -> PyResult<Vec<PyPDFPage>> {
+        // Safety: slf is a valid, live Python object for the duration of this call.
+        let py_doc = unsafe { Py::<PyAny>::from_borrowed_ptr(py, slf.as_ptr()) };
+        let inner = Arc::clone(&slf.inner);
+        let pages = py
+            .detach(|| {
+                indices
+                    .iter()
+                    .map(|&index| inner.get_page_cached(index).map_err(|e| (index, e)))
+                    .collect::<Result<Vec<_>, _>>()
+            })
+            .map_err(|(index, e)| {
+                PyValueError::new_err(format!("Failed to get page {}: {}", index, e))
+            })?;
+        pages
+            .into_iter()
+            .map(|page| PyPDFPage::from_core(py, page, Arc::clone(&inner), Some(&py_doc)))
+            .collect()
     }
 
     /// Get document info dictionaries.
@@ -0,0 +1,120 @@
+"""Generate the typing stubs for the lazy bolivar re-export modules.
+
+``bolivar/__init__.py`` and ``bolivar/_native_api.py`` resolve native symbols
+at runtime through ``__getattr__``.  Their companion ``.pyi`` files re-export
+each ``__all__`` symbol from ``bolivar._bolivar`` so type checkers see the real
+signatures without the runtime modules carrying import blocks.
+
+Run without arguments to rewrite the stubs.  Pass ``--check`` to exit 1 when a
+stub is out of date instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "crates" / "python" / "python" / "bolivar"
+MODULES = (PACKAGE / "__init__.py", PACKAGE / "_native_api.py")
+HEADER = "# Generated by scripts/gen_native_api_stubs.py; do not edit by hand.\n"
+LINE_LENGTH = 88
+
+
+def extract_all_names(tree: ast.Module) -> list[str]:
+    """Return the string entries of the module-level ``__all__`` list."""
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if (
+                isinstance(target, ast.Name)
+                and target.id == "__all__"
+                and isinstance(node.value, ast.List)
+            ):
+                return [
+                    elt.value
+                    for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                ]
+    return []
+
+
+def _import_order(name: str) -> tuple[int, str]:
+    # Match ruff's isort ordering: constants, classes, then everything else.
+    if name.isupper():
+        group = 0
+    elif name[:1].isupper():
+        group = 1
+    else:
+        group = 2
+    return group, name.lower()
+
+
+def _reexport(name: str) -> str:
+    line = f"from bolivar._bolivar import {name} as {name}"
+    if len(line) <= LINE_LENGTH:
+        return line
+    return f"from bolivar._bolivar import (\n    {name} as {name},\n)"
+
+
+def _function_stubs(tree: ast.Module) -> list[str]:
+    stubs = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef) or node.name == "__getattr__":
+            continue
+        returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+        stubs.append(f"def {node.name}({ast.unparse(node.args)}){returns}: ...")
+    return stubs
+
+
+def render_stub(path: Path) -> str:
+    """Render the ``.pyi`` text for one lazy re-export module."""
+    tree = ast.parse(path.read_text())
+    all_names = extract_all_names(tree)
+    functions = _function_stubs(tree)
+    defined = {stub.split("(", 1)[0].removeprefix("def ") for stub in functions}
+
+    lines = [HEADER]
+    if any("ModuleType" in stub for stub in functions):
+        lines.extend(["from types import ModuleType", ""])
+    if path.name == "__init__.py":
+        lines.append("from bolivar import _native_api as _native_api")
+    for name in sorted(all_names, key=_import_order):
+        if name not in defined:
+            lines.append(_reexport(name))
+    lines.extend(["", "__all__ = ["])
+    lines.extend(f'    "{name}",' for name in all_names)
+    lines.append("]")
+    if functions:
+        lines.append("")
+        lines.extend(functions)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str]) -> int:
+    check = "--check" in argv
+    stale: list[Path] = []
+    for module in MODULES:
+        stub_path = module.with_suffix(".pyi")
+        rendered = render_stub(module)
+        current = stub_path.read_text() if stub_path.exists() else None
+        if current == rendered:
+            continue
+        stale.append(stub_path)
+        if not check:
+            stub_path.write_text(rendered)
+
+    if check and stale:
+        print("STALE stubs (run scripts/gen_native_api_stubs.py):")
+        for path in stale:
+            print(f"  - {path.relative_to(ROOT)}")
+        return 1
+    action = "checked" if check else "generated"
+    print(f"OK: {len(MODULES)} stubs {action}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,5 +1,9 @@
 import pdfplumber
 import asyncio
+import gc
+
+import pytest
+from pdfplumber.utils.exceptions import PdfminerException
 
 
 def test_pdfplumber_pages_async_iterates():
@@ -58,3 +62,72 @@ def test_async_page_extract_tables_without_prefetched_layout():
                 break
 
     asyncio.run(run())
+
+
+def test_pdfplumber_pages_async_yields_every_window_in_order():
+    path = "crates/core/tests/fixtures/pdfplumber/pdffill-demo.pdf"
+
+    async def run():
+        async with pdfplumber.open(path) as pdf:
+            expected = list(range(1, len(pdf.pages) + 1))
+            assert len(expected) > pdf.pages._prefetch_pages
+            got = [page.page_number async for page in pdf.pages]
+            assert got == expected
+
+    asyncio.run(run())
+
+
+def test_pdfplumber_pages_async_falls_back_to_single_pages(monkeypatch):
+    path = "crates/core/tests/fixtures/pdfplumber/pdffill-demo.pdf"
+
+    async def run():
+        async with pdfplumber.open(path) as pdf:
+            doc = pdf.doc
+            get_page = doc.get_page
+
+            def _failing_batch(indices):
+                raise ValueError(f"batch {list(indices)} failed")
+
+            def _get_page(index):
+                if index == 5:
+                    raise ValueError("page 5 failed")
+                return get_page(index)
+
+            monkeypatch.setattr(doc, "get_pages_batch", _failing_batch)
+            monkeypatch.setattr(doc, "get_page", _get_page)
+            got = []
+            with pytest.raises(PdfminerException):
+                async for page in pdf.pages:
+                    got.append(page.page_number)
+            assert got == [1, 2, 3, 4, 5]
+
+    asyncio.run(run())
+
+
+def test_pdfplumber_pages_async_break_retrieves_failed_prefetch(monkeypatch):
+    path = "crates/core/tests/fixtures/pdfplumber/pdffill-demo.pdf"
+    errors = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda _loop, context: errors.append(context)
+        )
+        async with pdfplumber.open(path) as pdf:
+            doc = pdf.doc
+            get_pages_batch = doc.get_pages_batch
+
+            def _batch(indices):
+                if indices[0] > 0:
+                    raise ValueError("later batch failed")
+                return get_pages_batch(indices)
+
+            monkeypatch.setattr(doc, "get_pages_batch", _batch)
+            pages = pdf.pages.__aiter__()
+            async for _page in pages:
+                await asyncio.sleep(0.05)
+                break
+            await pages.aclose()
+        gc.collect()
+
+    asyncio.run(run())
+    assert errors == []
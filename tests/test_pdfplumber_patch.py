@@ -30,6 +30,13 @@ def _reload_pdfplumber(monkeypatch):
     return pdfplumber
 
 
+_PDFFILL_DEMO = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "crates/core/tests/fixtures/pdfplumber/pdffill-demo.pdf",
+)
+
+
 def test_pdfplumber_patch_default_on(monkeypatch):
     pdfplumber = _reload_pdfplumber(monkeypatch)
     assert (
@@ -99,6 +106,77 @@ def test_pdfplumber_pages_supports_index_objects(monkeypatch):
         assert last.page_number == len(pages)
 
 
+def test_pdfplumber_pages_cache_is_bounded_and_closes_evicted_pages(monkeypatch):
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+    closed = []
+    orig_close = pdfplumber.page.Page.close
+
+    def _recording_close(self):
+        closed.append(self.page_number)
+        return orig_close(self)
+
+    monkeypatch.setattr(pdfplumber.page.Page, "close", _recording_close)
+
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        pages = pdf.pages
+        pages._page_cache_limit = 2
+        first = pages[0]
+        assert pages[0] is first
+        pages[1]
+        pages[2]
+        assert list(pages._page_cache) == [1, 2]
+        assert closed == [1]
+        # Touching index 1 makes it most recent, so the next miss evicts 2.
+        pages[1]
+        pages[3]
+        assert list(pages._page_cache) == [1, 3]
+        assert closed == [1, 3]
+        rebuilt = pages[0]
+        assert rebuilt is not first
+        assert rebuilt.page_number == first.page_number
+        assert len(pages._page_cache) == 2
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [("5", 5), ("0", 32), ("-3", 32), ("many", 32)]
+)
+def test_pdfplumber_pages_cache_limit_reads_env(monkeypatch, value, expected):
+    monkeypatch.setenv("BOLIVAR_PAGE_CACHE", value)
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        assert pdf.pages._page_cache_limit == expected
+
+
+@pytest.mark.parametrize(
+    "error", [ValueError, OverflowError, OSError, RuntimeError], ids=repr
+)
+def test_pdfplumber_pages_wrap_native_errors(monkeypatch, error):
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+    from pdfplumber.utils.exceptions import PdfminerException
+
+    def _failing_get_page(index):
+        raise error(f"page {index} failed")
+
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        monkeypatch.setattr(pdf.doc, "get_page", _failing_get_page)
+        with pytest.raises(PdfminerException, match="page 0 failed") as excinfo:
+            pdf.pages[0]
+        assert isinstance(excinfo.value.__cause__, error)
+
+
+def test_pdfplumber_pages_propagate_other_errors(monkeypatch):
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    def _failing_get_page(index):
+        raise TypeError(f"page {index} failed")
+
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        monkeypatch.setattr(pdf.doc, "get_page", _failing_get_page)
+        with pytest.raises(TypeError):
+            pdf.pages[0]
+
+
 def test_page_init_prefers_direct_boxes_without_attrs(monkeypatch):
     pdfplumber = _reload_pdfplumber(monkeypatch)
 
@@ -317,6 +395,92 @@ def test_extract_tables_reuses_stream_across_adjacent_original_pages(monkeypatch
     assert calls["indexed_count"] == 0
 
 
+def _install_fake_tables_stream(monkeypatch, fail_at=None):
+    import bolivar._native_api as native_api
+
+    calls = {"stream_count": 0, "read": []}
+
+    def _fake_extract_tables_stream(
+        doc,
+        geometries,
+        table_settings=None,
+        laparams=None,
+        page_numbers=None,
+        maxpages=0,
+        caching=True,
+    ):
+        del doc, table_settings, laparams, page_numbers, maxpages, caching
+        calls["stream_count"] += 1
+        stream_number = calls["stream_count"]
+
+        def _stream():
+            for idx in range(len(geometries)):
+                if fail_at is not None and fail_at(stream_number, idx):
+                    raise ValueError(f"page {idx} failed")
+                calls["read"].append(idx)
+                yield idx, [[[f"p{idx}"]]]
+
+        return _stream()
+
+    monkeypatch.setattr(
+        native_api, "_extract_tables_stream", _fake_extract_tables_stream
+    )
+    return calls
+
+
+def test_extract_tables_prefetch_stops_at_furthest_requested_page(monkeypatch):
+    calls = _install_fake_tables_stream(
+        monkeypatch, fail_at=lambda _stream_number, idx: idx == 5
+    )
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    settings = {"vertical_strategy": "lines"}
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        assert len(pdf.pages) > 5
+        got = [pdf.pages[i].extract_tables(settings) for i in (4, 2, 1, 0, 1)]
+        # The fourth out-of-order read re-reads up to page 4 and caches it.
+        assert calls["stream_count"] == 5
+        assert max(calls["read"]) == 4
+        got += [pdf.pages[i].extract_tables(settings) for i in (0, 2, 3)]
+        assert calls["stream_count"] == 5
+        with pytest.raises(ValueError):
+            pdf.pages[5].extract_tables(settings)
+
+    assert got == [[[[f"p{i}"]]] for i in (4, 2, 1, 0, 1, 0, 2, 3)]
+
+
+def test_extract_tables_failed_prefetch_falls_back_to_restarts(monkeypatch):
+    calls = _install_fake_tables_stream(
+        monkeypatch, fail_at=lambda stream_number, _idx: stream_number == 5
+    )
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    settings = {"vertical_strategy": "lines"}
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        got = [pdf.pages[i].extract_tables(settings) for i in (4, 2, 1, 0, 1)]
+        assert calls["stream_count"] == 6
+        got += [pdf.pages[i].extract_tables(settings) for i in (0, 2)]
+        # Later misses restart the stream instead of retrying the prefetch.
+        assert calls["stream_count"] == 8
+
+    assert got == [[[[f"p{i}"]]] for i in (4, 2, 1, 0, 1, 0, 2)]
+
+
+def test_extract_tables_settings_edited_in_place_start_new_stream(monkeypatch):
+    calls = _install_fake_tables_stream(monkeypatch)
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    settings = {"vertical_strategy": "lines", "explicit_vertical_lines": [10]}
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        pdf.pages[0].extract_tables(settings)
+        pdf.pages[1].extract_tables(settings)
+        assert calls["stream_count"] == 1
+        settings["explicit_vertical_lines"].append(20)
+        pdf.pages[1].extract_tables(settings)
+        assert calls["stream_count"] == 2
+        assert len(pdf._bolivar_settings_keys) == 1
+
+
 def test_extract_tables_cropped_page_uses_page_objects_backend(monkeypatch):
     import bolivar._native_api as native_api
 
@@ -459,12 +623,44 @@ def test_extract_text_reuses_text_stream(monkeypatch):
         with pdfplumber.open(pdf_path) as pdf:
             _ = pdf.pages[0].extract_text()
             _ = pdf.pages[1].extract_text()
+            assert not hasattr(pdf, "_bolivar_settings_keys")
     finally:
         sys.setprofile(prior_profiler)
 
     assert calls["count"] == 2
 
 
+def test_extract_text_restarts_stream_after_laparams_edit(monkeypatch):
+    import bolivar._native_api as native_api
+
+    seen = []
+
+    def _fake_extract_text_stream(
+        doc,
+        geometries,
+        text_settings=None,
+        laparams=None,
+        page_numbers=None,
+        maxpages=0,
+        caching=True,
+    ):
+        del doc, text_settings, maxpages, caching
+        seen.append(laparams.char_margin)
+        indices = page_numbers or range(len(geometries))
+        return iter([(idx, f"margin {laparams.char_margin}") for idx in indices])
+
+    monkeypatch.setattr(native_api, "_extract_text_stream", _fake_extract_text_stream)
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    with pdfplumber.open(_PDFFILL_DEMO, laparams={"char_margin": 2.0}) as pdf:
+        assert pdf.pages[0].extract_text() == "margin 2.0"
+        assert pdf.pages[0].extract_text() == "margin 2.0"
+        pdf.laparams.char_margin = 3.0
+        assert pdf.pages[0].extract_text() == "margin 3.0"
+
+    assert seen == [2.0, 3.0]
+
+
 def test_extract_words_reuses_words_stream(monkeypatch):
     import bolivar._bolivar as _bolivar
 
@@ -488,6 +684,7 @@ def test_extract_words_reuses_words_stream(monkeypatch):
         with pdfplumber.open(pdf_path) as pdf:
             _ = pdf.pages[0].extract_words()
             _ = pdf.pages[1].extract_words()
+            assert not hasattr(pdf, "_bolivar_settings_keys")
     finally:
         sys.setprofile(prior_profiler)
 
@@ -507,6 +704,32 @@ def test_extract_tables_creates_table_stream_cache_for_original_pages(monkeypatc
         assert isinstance(pdf._bolivar_table_streams, dict)
 
 
+def test_extract_tables_evicts_least_recent_table_stream(monkeypatch):
+    monkeypatch.setenv("BOLIVAR_TABLE_CACHE_MAX", "2")
+    calls = _install_fake_tables_stream(monkeypatch)
+    pdfplumber = _reload_pdfplumber(monkeypatch)
+
+    settings = [{"snap_tolerance": tolerance} for tolerance in (1, 2, 3)]
+    with pdfplumber.open(_PDFFILL_DEMO) as pdf:
+        page = pdf.pages[0]
+        for table_settings in settings:
+            page.extract_tables(table_settings)
+        streams = pdf._bolivar_table_streams
+        assert len(streams) == 2
+        assert calls["stream_count"] == 3
+        # The second settings' stream is reused and becomes most recent, so
+        # bringing back the first settings evicts the third.
+        page.extract_tables(settings[1])
+        assert calls["stream_count"] == 3
+        page.extract_tables(settings[0])
+        assert calls["stream_count"] == 4
+        page.extract_tables(settings[1])
+        assert calls["stream_count"] == 4
+        page.extract_tables(settings[2])
+        assert calls["stream_count"] == 5
+        assert len(streams) == 2
+
+
 def test_extract_tables_rejects_threads_kw(monkeypatch):
     pdfplumber = _reload_pdfplumber(monkeypatch)
     pdf_path = os.path.join(
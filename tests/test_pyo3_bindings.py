@@ -61,6 +61,29 @@ class TestPDFDocument:
         obj2 = doc.getobj(11)
         assert obj1 is obj2
 
+    def test_get_pages_batch_returns_pages_in_order(self):
+        """PDFDocument.get_pages_batch() follows the order of the indices"""
+        from bolivar import PDFDocument
+
+        pdf_path = FIXTURES_DIR / "pdfplumber/pdffill-demo.pdf"
+        doc = PDFDocument(pdf_path.read_bytes())
+
+        indices = [2, 0, 1]
+        pages = doc.get_pages_batch(indices)
+        assert [page.pageid for page in pages] == [
+            doc.get_page(index).pageid for index in indices
+        ]
+
+    def test_get_pages_batch_rejects_out_of_range_index(self):
+        """PDFDocument.get_pages_batch() raises when any index is invalid"""
+        from bolivar import PDFDocument
+
+        pdf_path = FIXTURES_DIR / "pdfplumber/pdffill-demo.pdf"
+        doc = PDFDocument(pdf_path.read_bytes())
+
+        with pytest.raises(ValueError):
+            doc.get_pages_batch([0, 10_000])
+
 
 class TestPDFPage:
     """Test PDFPage wrapper"""
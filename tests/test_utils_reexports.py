@@ -13,3 +13,22 @@ def test_utils_reexported_from_rust():
 
 def test_numbertree_reexported_from_rust():
     assert ds.NumberTree is core.NumberTree
+
+
+def test_numbertree_lookup_handles_unsorted_and_duplicate_keys():
+    tree = core.NumberTree(
+        {
+            "Kids": [
+                {"Nums": [5, "five", 1, "one"]},
+                {"Nums": [3, "three", 1, "one again"]},
+            ]
+        }
+    )
+
+    assert tree.lookup(1) == "one"
+    assert tree.lookup(3) == "three"
+    assert tree.lookup(5) == "five"
+    assert tree.lookup(2) is None
+    assert tree.lookup(6) is None
+    assert tree.values == [(5, "five"), (1, "one"), (3, "three"), (1, "one again")]
+    assert list(tree) == tree.values